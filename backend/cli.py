@@ -0,0 +1,27 @@
+"""
+Run the syllabus extraction on a local PDF (no Supabase, no server).
+
+    python -m backend.cli test.pdf
+"""
+import argparse
+
+import orjson
+
+from backend.main import extract_course_and_events_with_gemini, extract_text_from_pdf_bytes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract course + events from a syllabus PDF.")
+    parser.add_argument("pdf_path", nargs="?", default="test.pdf", help="path to the PDF (default: test.pdf)")
+    args = parser.parse_args()
+
+    with open(args.pdf_path, "rb") as f:
+        text = extract_text_from_pdf_bytes(f.read())
+    course, events = extract_course_and_events_with_gemini(text)
+
+    print("--- JSON DATA FROM AI ---")
+    print(orjson.dumps({"course": course, "events": events}, option=orjson.OPT_INDENT_2).decode())
+
+
+if __name__ == "__main__":
+    main()
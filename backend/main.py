@@ -2,34 +2,113 @@
 Syllabus Scanner API – Step 1 & 2
 - Receives a PDF URL, extracts text, sends to Gemini, saves events to Supabase.
 """
+import asyncio
+import hashlib
 import io
-import json
+import logging
 import os
 import re
+import shutil
+import subprocess
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 
-import requests
+import aiohttp
+import orjson
+import redis
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from pypdf import PdfReader
 from supabase import create_client, Client
 
+from backend.schedule import PAGE_BREAK, extract_course_and_events_with_regex
+
+try:
+    import pymupdf  # C-backed (MuPDF), much faster than pypdf
+except ImportError:  # fall back to pure-Python pypdf
+    pymupdf = None
+    from pypdf import PdfReader
+
+# Threads for the pypdf fallback on longer PDFs
+_PDF_WORKERS = min(8, os.cpu_count() or 4)
+
+# poppler's native pdftotext is the fastest extractor when it's installed
+_PDFTOTEXT = shutil.which("pdftotext")
+
 # Load env first
 load_dotenv()
 
-# ----- Gemini setup (reuse your scanner logic) -----
+logger = logging.getLogger(__name__)
+
+# ----- Gemini setup -----
 import google.generativeai as genai
 
 genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
-gemini_model = genai.GenerativeModel("gemini-2.5-flash")
+
+# Static instructions go in the system instruction so every request shares the
+# same prefix (eligible for Gemini's prefix caching); only the syllabus varies.
+SYLLABUS_INSTRUCTION = """
+From the syllabus the user sends, extract:
+1) The course name or code (e.g. "CPE 380", "BIO 101", "CS 161"). Put it in a field called "course".
+2) All assignments, exams, and important dates as a list called "events".
+
+Return ONLY a single JSON object with this shape:
+{ "course": "Course Name or Code", "events": [ { "title": "...", "date": "YYYY-MM-DD", "type": "Assignment|Exam|Quiz|Project|..." } ] }
+
+Use the date format YYYY-MM-DD for each event when possible.
+"""
+
+# Ask for JSON directly (no markdown fences or prose around it)
+SYLLABUS_RESPONSE_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "course": {"type": "STRING"},
+        "events": {
+            "type": "ARRAY",
+            "items": {
+                "type": "OBJECT",
+                "properties": {
+                    "title": {"type": "STRING"},
+                    "date": {"type": "STRING"},
+                    "type": {"type": "STRING"},
+                },
+                "required": ["title", "date"],
+            },
+        },
+    },
+}
+
+GEMINI_MODEL_NAME = "gemini-2.5-flash"
+
+gemini_model = genai.GenerativeModel(
+    GEMINI_MODEL_NAME,
+    system_instruction=SYLLABUS_INSTRUCTION,
+    generation_config={
+        "response_mime_type": "application/json",
+        "response_schema": SYLLABUS_RESPONSE_SCHEMA,
+    },
+)
+
+# Part of every Gemini cache key, so changing the model, prompt or schema
+# never serves results produced under the old ones
+GEMINI_CACHE_VERSION = hashlib.sha256(
+    GEMINI_MODEL_NAME.encode("utf-8")
+    + SYLLABUS_INSTRUCTION.encode("utf-8")
+    + orjson.dumps(SYLLABUS_RESPONSE_SCHEMA, option=orjson.OPT_SORT_KEYS)
+).hexdigest()[:16]
 
 # ----- Supabase client (created on first use so server can start even if key is wrong) -----
 SUPABASE_URL = (os.getenv("SUPABASE_URL") or "").strip()
 SUPABASE_SERVICE_KEY = (os.getenv("SUPABASE_SERVICE_ROLE_KEY") or "").strip()
 
 _supabase: Client | None = None
+_events_table = None  # request builder for "events", reused across calls
 
 
 def get_supabase() -> Client:
@@ -43,10 +122,94 @@ def get_supabase() -> Client:
         _supabase = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
     return _supabase
 
+
+def get_events_table():
+    """The "events" table builder. Builders don't keep per-query state, so one can be shared."""
+    global _events_table
+    if _events_table is None:
+        _events_table = get_supabase().table("events")
+    return _events_table
+
+
+# ----- Cache: small in-process LRU (L1) in front of Redis (L2, if REDIS_URL is set) -----
+# Best effort: cache errors count as a miss and never fail a request.
+REDIS_URL = (os.getenv("REDIS_URL") or "").strip()
+GEMINI_CACHE_TTL = 7 * 24 * 3600  # one week
+PDF_TEXT_CACHE_TTL = 24 * 3600  # one day
+
+_redis = None
+_local_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+_local_cache_lock = threading.Lock()
+_LOCAL_CACHE_MAX = 128
+_LOCAL_CACHE_TTL = 3600  # cap for L1 entries, so instances don't drift far from Redis
+_REDIS_TIMEOUT = 0.5  # seconds; an unreachable Redis should cost a request little
+
+
+def _get_redis():
+    global _redis
+    if _redis is None and REDIS_URL:
+        _redis = redis.Redis.from_url(
+            REDIS_URL,
+            decode_responses=True,
+            socket_connect_timeout=_REDIS_TIMEOUT,
+            socket_timeout=_REDIS_TIMEOUT,
+        )
+    return _redis
+
+
+def _local_get(key: str) -> str | None:
+    with _local_cache_lock:
+        entry = _local_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del _local_cache[key]
+            return None
+        _local_cache.move_to_end(key)
+        return value
+
+
+def _local_set(key: str, value: str, ttl: int) -> None:
+    with _local_cache_lock:
+        _local_cache[key] = (time.monotonic() + min(ttl, _LOCAL_CACHE_TTL), value)
+        _local_cache.move_to_end(key)
+        while len(_local_cache) > _LOCAL_CACHE_MAX:
+            _local_cache.popitem(last=False)
+
+
+def cache_get(key: str) -> str | None:
+    """Look up a cached string: in-process first, then Redis."""
+    value = _local_get(key)
+    if value is not None:
+        return value
+    r = _get_redis()
+    if r is None:
+        return None
+    try:
+        value = r.get(key)
+    except redis.RedisError:
+        return None
+    if value is not None:
+        _local_set(key, value, _LOCAL_CACHE_TTL)
+    return value
+
+
+def cache_set(key: str, value: str, ttl: int) -> None:
+    """Store a string for ttl seconds in both tiers."""
+    _local_set(key, value, ttl)
+    r = _get_redis()
+    if r is not None:
+        try:
+            r.set(key, value, ex=ttl)
+        except redis.RedisError:
+            pass
+
 # ----- FastAPI app -----
 app = FastAPI(
     title="Syllabus Scanner API",
     description="Upload a syllabus PDF URL → extract events → save to Supabase",
+    default_response_class=ORJSONResponse,  # faster encoding for large event lists
 )
 
 # Allow the React frontend (local + deployed) to call this API
@@ -58,6 +221,36 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# One shared aiohttp session for downloading PDFs (opened with the event loop).
+# Its connector keeps connections alive, so repeat downloads from the same
+# host (e.g. Supabase Storage) skip the DNS lookup and TLS handshake.
+_http: aiohttp.ClientSession | None = None
+_HTTP_POOL_SIZE = 32
+_RETRY_STATUSES = {502, 503, 504}
+_DOWNLOAD_RETRIES = 2
+_RETRY_BACKOFF = 0.3  # seconds, doubled on each retry
+
+MAX_PDF_BYTES = 25 * 1024 * 1024  # reject anything bigger before parsing it
+_DOWNLOAD_CHUNK = 64 * 1024
+
+
+@app.on_event("startup")
+async def _open_http_session():
+    global _http
+    _http = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=_HTTP_POOL_SIZE,
+            limit_per_host=_HTTP_POOL_SIZE,
+            ttl_dns_cache=300,
+        ),
+    )
+
+
+@app.on_event("shutdown")
+async def _close_http_session():
+    if _http is not None:
+        await _http.close()
+
 
 # ----- Request/response models -----
 class ProcessSyllabusRequest(BaseModel):
@@ -77,39 +270,105 @@ class DeleteClassRequest(BaseModel):
 
 
 # ----- Helpers -----
+# Only pages that look like they mention a date are worth sending to Gemini
+_DATE_HINT = re.compile(
+    r"\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{1,2}"
+    r"|\d{1,2}/\d{1,2}"
+    r"|\d{4}-\d{2}-\d{2}",
+    re.IGNORECASE,
+)
+MAX_SYLLABUS_CHARS = 60_000
+
+
 def extract_text_from_pdf_bytes(pdf_bytes: bytes) -> str:
-    """Extract text from PDF bytes (from a URL or file)."""
-    reader = PdfReader(io.BytesIO(pdf_bytes))
-    text = ""
-    for page in reader.pages:
-        text += page.extract_text() + "\n"
-    return text.strip()
+    """Extract text from PDF bytes (from a URL or file), pages separated by PAGE_BREAK."""
+    if _PDFTOTEXT:
+        try:
+            return _extract_text_pdftotext(pdf_bytes)
+        except (OSError, subprocess.SubprocessError):
+            pass  # fall through to the Python extractors
+    if pymupdf is None:
+        return _extract_text_pypdf(pdf_bytes)
+    doc = pymupdf.open(stream=pdf_bytes, filetype="pdf")
+    try:
+        return PAGE_BREAK.join(page.get_text("text") for page in doc).strip()
+    finally:
+        doc.close()
 
 
-def extract_course_and_events_with_gemini(syllabus_text: str) -> tuple[str | None, list[dict]]:
-    """Send syllabus text to Gemini. Returns (course_name, list of event dicts)."""
-    prompt = f"""
-From the syllabus below, extract:
-1) The course name or code (e.g. "CPE 380", "BIO 101", "CS 161"). Put it in a field called "course".
-2) All assignments, exams, and important dates as a list called "events".
+def _extract_text_pdftotext(pdf_bytes: bytes) -> str:
+    """Pipe the PDF through poppler's pdftotext (stdin → stdout, no temp files)."""
+    result = subprocess.run(
+        [_PDFTOTEXT, "-q", "-", "-"],  # keeps its \f page breaks
+        input=pdf_bytes,
+        capture_output=True,
+        timeout=30,
+        check=True,
+    )
+    return result.stdout.decode("utf-8", "replace").strip()
 
-Return ONLY a single JSON object with this shape:
-{{ "course": "Course Name or Code", "events": [ {{ "title": "...", "date": "YYYY-MM-DD", "type": "Assignment|Exam|Quiz|Project|..." }} ] }}
 
-Use the date format YYYY-MM-DD for each event when possible.
+def _extract_text_pypdf(pdf_bytes: bytes) -> str:
+    """Slower pure-Python fallback when PyMuPDF isn't installed."""
+    reader = PdfReader(io.BytesIO(pdf_bytes))
+    page_count = len(reader.pages)
+    if page_count < 4:  # not worth a thread pool
+        parts = []
+        for page in reader.pages:
+            parts.append(page.extract_text() or "")
+        return PAGE_BREAK.join(parts).strip()
+
+    # A PdfReader seeks one shared stream, so it isn't thread-safe: each worker
+    # opens its own reader over the same bytes and handles a contiguous range of pages.
+    step = -(-page_count // min(_PDF_WORKERS, page_count))
+    ranges = [range(i, min(i + step, page_count)) for i in range(0, page_count, step)]
+    with ThreadPoolExecutor(max_workers=len(ranges)) as ex:
+        chunks = list(ex.map(lambda pages: _extract_pages_pypdf(pdf_bytes, pages), ranges))
+    return PAGE_BREAK.join(text for chunk in chunks for text in chunk).strip()
+
+
+def _extract_pages_pypdf(pdf_bytes: bytes, page_numbers: range) -> list[str]:
+    reader = PdfReader(io.BytesIO(pdf_bytes))
+    return [reader.pages[i].extract_text() or "" for i in page_numbers]
 
-Syllabus Text:
-{syllabus_text}
-"""
-    response = gemini_model.generate_content(prompt)
-    raw = (response.text or "").strip()
 
-    if raw.startswith("```"):
-        raw = re.sub(r"^```(?:json)?\s*", "", raw)
-        raw = re.sub(r"\s*```\s*$", "", raw)
+def extract_course_and_events_with_gemini(syllabus_text: str) -> tuple[str | None, list[dict]]:
+    """Send syllabus text to Gemini. Returns (course_name, list of event dicts).
+
+    The text is trimmed first (see trim_syllabus_text). Non-empty results are
+    cached by a hash of the whitespace/case-normalized text (plus the model and
+    prompt version), so re-uploading the same syllabus skips the Gemini call entirely.
+    """
+    syllabus_text = trim_syllabus_text(syllabus_text)
+    normalized = " ".join(syllabus_text.split()).lower()
+    digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+    key = f"gemini:{GEMINI_CACHE_VERSION}:{digest}"
+    cached = cache_get(key)
+    if cached is not None:
+        data = orjson.loads(cached)
+        return data["course"], data["events"]
+
+    course, events = _ask_gemini(syllabus_text)
+    if events:  # an empty answer may be a one-off; don't pin it for a week
+        payload = orjson.dumps({"course": course, "events": events}).decode()
+        cache_set(key, payload, GEMINI_CACHE_TTL)
+    return course, events
+
+
+def trim_syllabus_text(syllabus_text: str) -> str:
+    """Cut input tokens: keep the first page (course name) plus pages that mention dates, capped."""
+    pages = syllabus_text.split(PAGE_BREAK)
+    kept = [pages[0]] + [page for page in pages[1:] if _DATE_HINT.search(page)]
+    return PAGE_BREAK.join(kept)[:MAX_SYLLABUS_CHARS]
+
+
+def _ask_gemini(syllabus_text: str) -> tuple[str | None, list[dict]]:
+    """Uncached Gemini call behind extract_course_and_events_with_gemini."""
+    response = gemini_model.generate_content(f"Syllabus Text:\n{syllabus_text}")
+    raw = (response.text or "").strip()
     try:
-        data = json.loads(raw)
-    except json.JSONDecodeError as e:
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError as e:
         raise ValueError(f"Gemini did not return valid JSON: {e}\nRaw: {raw[:500]}")
 
     # Accept { course, events } or legacy array-only format
@@ -126,20 +385,64 @@ Syllabus Text:
     return None, []
 
 
+_ISO_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_DATE_FORMATS = ("%Y-%m-%d", "%m/%d/%Y", "%B %d, %Y", "%b %d, %Y", "%d %B %Y")
+
+
 def parse_event_date(date_str: str) -> str:
     """Turn a date string from Gemini into YYYY-MM-DD for the database."""
-    if not date_str:
-        return datetime.now().strftime("%Y-%m-%d")
+    parsed = _parse_date_string(str(date_str).strip()) if date_str else None
+    return parsed or datetime.now().strftime("%Y-%m-%d")
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_string(date_str: str) -> str | None:
+    """Memoized parse (syllabi repeat dates a lot). None if no format matches.
+
+    The "today" fallback stays in parse_event_date so it is never cached.
+    """
     # Already YYYY-MM-DD
-    if re.match(r"^\d{4}-\d{2}-\d{2}$", str(date_str).strip()):
-        return str(date_str).strip()
+    if _ISO_DATE.match(date_str):
+        return date_str
     # Try common formats
-    for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%B %d, %Y", "%b %d, %Y", "%d %B %Y"):
+    for fmt in _DATE_FORMATS:
         try:
-            return datetime.strptime(str(date_str).strip(), fmt).strftime("%Y-%m-%d")
+            return datetime.strptime(date_str, fmt).strftime("%Y-%m-%d")
         except ValueError:
             continue
-    return datetime.now().strftime("%Y-%m-%d")
+    return None
+
+
+EVENTS_INSERT_BATCH = 500  # rows per request, well under PostgREST's body limits
+# Matches the unique index from supabase_events_unique_index.sql
+EVENTS_CONFLICT_COLUMNS = "user_id,course_name,event_title,event_date"
+
+
+def dedupe_event_rows(rows: list[dict]) -> list[dict]:
+    """Drop repeated (title, date) rows; Gemini sometimes lists a date table twice."""
+    seen = set()
+    deduped = []
+    for row in rows:
+        key = (row["event_title"], row["event_date"])
+        if key in seen:
+            continue
+        seen.add(key)
+        deduped.append(row)
+    return deduped
+
+
+def save_event_rows(rows: list[dict]) -> None:
+    """Upsert event rows into Supabase in batches, so re-processing a syllabus is idempotent.
+
+    returning="minimal" skips echoing the rows back; the caller already has them.
+    """
+    upsert = get_events_table().upsert
+    for i in range(0, len(rows), EVENTS_INSERT_BATCH):
+        upsert(
+            rows[i:i + EVENTS_INSERT_BATCH],
+            on_conflict=EVENTS_CONFLICT_COLUMNS,
+            returning="minimal",
+        ).execute()
 
 
 # ----- Endpoints -----
@@ -150,10 +453,10 @@ def health():
 
 
 @app.post("/process-syllabus")
-def process_syllabus(body: ProcessSyllabusRequest):
+async def process_syllabus(body: ProcessSyllabusRequest):
     """Download PDF → Gemini → save to Supabase. Returns events."""
     try:
-        return _process_syllabus_impl(body)
+        return await _process_syllabus_impl(body)
     except HTTPException:
         raise
     except Exception as e:
@@ -164,9 +467,8 @@ def process_syllabus(body: ProcessSyllabusRequest):
 def delete_class(body: DeleteClassRequest):
     """Delete all events for a specific course for this user."""
     try:
-        supa = get_supabase()
         (
-            supa.table("events")
+            get_events_table()
             .delete()
             .eq("user_id", body.user_id)
             .eq("course_name", body.course_name)
@@ -180,58 +482,51 @@ def delete_class(body: DeleteClassRequest):
     return {"status": "ok"}
 
 
-def _process_syllabus_impl(body: ProcessSyllabusRequest):
+async def _process_syllabus_impl(body: ProcessSyllabusRequest):
     file_url = body.file_url.strip()
     user_id = body.user_id.strip() if body.user_id else None
     source_filename = (body.source_filename or "syllabus.pdf").strip()
     course_override = (body.course_name or "").strip() or None
 
-    # 1. Download PDF
-    try:
-        resp = requests.get(file_url, timeout=30)
-        resp.raise_for_status()
-        pdf_bytes = resp.content
-    except requests.RequestException as e:
-        raise HTTPException(status_code=400, detail=f"Could not download PDF: {e}")
-
-    if len(pdf_bytes) == 0:
-        raise HTTPException(status_code=400, detail="PDF file is empty")
-
-    # 2. Extract text and get course + events from Gemini
-    try:
-        text = extract_text_from_pdf_bytes(pdf_bytes)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Could not read PDF: {e}")
+    # 1. Download the PDF and get its text (parse skipped for contents seen before)
+    text = await _load_pdf_text(file_url)
 
     if not text:
         raise HTTPException(status_code=400, detail="No text could be extracted from the PDF")
 
-    try:
-        course_from_ai, events_from_ai = extract_course_and_events_with_gemini(text)
-    except ValueError as e:
-        raise HTTPException(status_code=502, detail=str(e))
+    # 2. Get course + events: a regex pass first, Gemini unless that pass is confident
+    course_from_ai, events_from_ai, confident = extract_course_and_events_with_regex(text)
+    if not (confident and (course_override or course_from_ai)):
+        regex_events = events_from_ai
+        # Blocking SDK, so run it in a worker thread
+        try:
+            course_from_ai, events_from_ai = await asyncio.to_thread(
+                extract_course_and_events_with_gemini, text
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=502, detail=str(e))
+        _warn_on_missed_dates(file_url, regex_events, events_from_ai)
 
     course_name = course_override or course_from_ai or "Unnamed course"
 
-    # 3. Map to DB rows and insert into Supabase (include course_name)
-    rows = []
-    for ev in events_from_ai:
-        title = ev.get("title") or "Untitled"
-        date_str = ev.get("date") or ""
-        event_type = ev.get("type") or ""
-        rows.append({
+    # 3. Map to DB rows and save them to Supabase (include course_name)
+    rows = [
+        {
             "user_id": user_id,
             "source_filename": source_filename,
             "source_url": file_url,
             "course_name": course_name,
-            "event_date": parse_event_date(date_str),
-            "event_title": title,
-            "event_description": f"Type: {event_type}" if event_type else None,
-        })
+            "event_date": parse_event_date(ev.get("date") or ""),
+            "event_title": ev.get("title") or "Untitled",
+            "event_description": f"Type: {event_type}" if (event_type := ev.get("type")) else None,
+        }
+        for ev in events_from_ai
+    ]
+    rows = dedupe_event_rows(rows)
 
     if rows:
         try:
-            get_supabase().table("events").insert(rows).execute()
+            await asyncio.to_thread(save_event_rows, rows)
         except Exception as e:
             raise HTTPException(
                 status_code=500,
@@ -239,3 +534,89 @@ def _process_syllabus_impl(body: ProcessSyllabusRequest):
             )
 
     return {"events": rows, "count": len(rows), "course_name": course_name}
+
+
+def _warn_on_missed_dates(file_url: str, regex_events: list[dict], gemini_events: list[dict]) -> None:
+    """Sanity check: log dates the regex pass found that Gemini's answer doesn't have."""
+    if not regex_events:
+        return
+    gemini_dates = {parse_event_date(ev.get("date") or "") for ev in gemini_events}
+    missed = sorted({ev["date"] for ev in regex_events} - gemini_dates)
+    if missed:
+        logger.warning(
+            "Gemini missed %d of %d regex-found dates for %s: %s",
+            len(missed), len(regex_events), file_url, ", ".join(missed),
+        )
+
+
+async def _load_pdf_text(file_url: str) -> str:
+    """Download a PDF and extract its text, reusing cached text for identical file contents.
+
+    Keyed on a hash of the bytes, not the URL: the frontend uploads every file to a
+    fresh storage path, so the same syllabus re-uploaded still skips the parse.
+    """
+    try:
+        pdf_bytes = await _download_pdf(file_url)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        raise HTTPException(status_code=400, detail=f"Could not download PDF: {e}")
+
+    if len(pdf_bytes) == 0:
+        raise HTTPException(status_code=400, detail="PDF file is empty")
+
+    cache_key = "pdftext:" + hashlib.sha256(pdf_bytes).hexdigest()
+    cached = await asyncio.to_thread(cache_get, cache_key)
+    if cached is not None:
+        return cached
+
+    # Parsing is blocking, so run it in a worker thread
+    try:
+        text = await asyncio.to_thread(extract_text_from_pdf_bytes, pdf_bytes)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Could not read PDF: {e}")
+
+    if text:
+        await asyncio.to_thread(cache_set, cache_key, text, PDF_TEXT_CACHE_TTL)
+    return text
+
+
+async def _download_pdf(file_url: str) -> bytes:
+    """Stream the PDF into memory (size-capped), retrying brief upstream outages.
+
+    Retries 502/503/504 responses, dropped connections and timeouts, like
+    urllib3's Retry(total=2, backoff_factor=0.3).
+    """
+    for attempt in range(_DOWNLOAD_RETRIES + 1):
+        if attempt:
+            await asyncio.sleep(_RETRY_BACKOFF * 2 ** (attempt - 1))
+        last_attempt = attempt == _DOWNLOAD_RETRIES
+        try:
+            async with _http.get(file_url, timeout=aiohttp.ClientTimeout(total=30)) as resp:
+                if resp.status in _RETRY_STATUSES and not last_attempt:
+                    continue  # released back to the pool before we back off
+                resp.raise_for_status()
+                if (resp.content_length or 0) > MAX_PDF_BYTES:
+                    raise HTTPException(status_code=413, detail="PDF too large")
+                buf = bytearray()
+                async for chunk in resp.content.iter_chunked(_DOWNLOAD_CHUNK):
+                    buf.extend(chunk)
+                    if len(buf) > MAX_PDF_BYTES:
+                        raise HTTPException(status_code=413, detail="PDF too large")
+                return bytes(buf)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if last_attempt:
+                raise
+
+
+if __name__ == "__main__":
+    # `python -m backend.main`: multiple worker processes (parsing and JSON work is
+    # CPU-bound) on uvloop + httptools. WEB_CONCURRENCY is the usual host setting.
+    import uvicorn
+
+    uvicorn.run(
+        "backend.main:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "8000")),
+        workers=int(os.getenv("WEB_CONCURRENCY", "4")),
+        loop="uvloop",
+        http="httptools",
+    )
@@ -0,0 +1,127 @@
+"""
+Local (regex) syllabus extractor, tried before Gemini.
+- Handles neatly tabulated schedules: one "title ... date" line per event.
+- Deliberately strict; anything it isn't sure about goes to Gemini instead.
+"""
+import re
+from datetime import datetime
+
+# Extracted text keeps page boundaries as form feeds (pdftotext's own convention)
+PAGE_BREAK = "\f"
+REGEX_MIN_EVENTS = 5  # fewer than this and we ask Gemini instead
+
+# Course codes like "CPE 380" or "CS161A", looked for on the first page only
+_COURSE_CODE = re.compile(r"\b([A-Z]{2,4})\s?(\d{3}[A-Z]?)\b")
+# Code-shaped tokens that are really rooms, buildings, pages, ...
+_NOT_COURSE_PREFIXES = {
+    "ROOM", "RM", "BLDG", "HALL", "SUITE", "STE", "PAGE", "PG", "UNIT", "BOX", "APT", "EXT", "FAX", "TEL",
+}
+
+# Whole month names (or their abbreviations) followed by a space and a day, e.g.
+# "Mar. 12", "March 12, 2026"; numeric dates must carry a year ("3/12/2026"),
+# otherwise "5/10 points" or "chapters 3/4" would read as dates.
+_SCHEDULE_DATE = re.compile(
+    r"\b(?P<month>Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|June?|July?|Aug(?:ust)?"
+    r"|Sep(?:t(?:ember)?)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\.?\s+(?P<day>\d{1,2})\b"
+    r"(?:,\s*(?P<year>\d{4})\b)?"
+    r"|(?<![\d/])(?P<m>\d{1,2})/(?P<d>\d{1,2})/(?P<y>\d{4}|\d{2})(?![\d/])"
+)
+# The year for dates written without one: from the term ("Spring 2026"), not any
+# 20xx number, which could be a course or room number like "MATH 2001"
+_TERM_YEAR = re.compile(r"\b(?:Fall|Spring|Summer|Winter)\s+(20\d{2})\b", re.IGNORECASE)
+_MONTHS = ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec")
+# A line only counts as an event if it says what is due
+_EVENT_KINDS = (
+    ("Exam", re.compile(r"\b(exam|midterm|final)\b", re.IGNORECASE)),
+    ("Quiz", re.compile(r"\bquiz", re.IGNORECASE)),
+    ("Project", re.compile(r"\bproject", re.IGNORECASE)),
+    ("Assignment", re.compile(r"\b(homework|hw\s?\d|assignment|due|paper|essay|report)", re.IGNORECASE)),
+)
+
+
+def find_course_code(syllabus_text: str) -> str | None:
+    """First course-code-looking token on the first page, skipping rooms/pages/etc."""
+    first_page = syllabus_text.split(PAGE_BREAK, 1)[0]
+    for m in _COURSE_CODE.finditer(first_page):
+        if m.group(1) not in _NOT_COURSE_PREFIXES:
+            return m.group(0)
+    return None
+
+
+def extract_course_and_events_with_regex(syllabus_text: str) -> tuple[str | None, list[dict], bool]:
+    """Returns (course_code, events, confident).
+
+    Events have the same shape as Gemini's. Only lines naming an exam/quiz/project/
+    assignment are kept. Dates without a year take the term's year ("Fall 2025"), or
+    else the first year spelled out in a schedule date; with neither, they are dropped.
+    Lines with more than one date are skipped, since the title can't be split reliably.
+    confident is True only when the year is known, there are no such multi-date lines,
+    there are at least REGEX_MIN_EVENTS events, they make up most of the dated lines,
+    and their dates never go backwards; otherwise callers should ask Gemini.
+    """
+    course = find_course_code(syllabus_text)
+    default_year = _default_year(syllabus_text)
+
+    events = []
+    dated_lines = 0
+    multi_date_lines = 0
+    for line in syllabus_text.splitlines():
+        matches = list(_SCHEDULE_DATE.finditer(line))
+        if not matches:
+            continue
+        dated_lines += 1
+        if len(matches) > 1:
+            multi_date_lines += 1
+            continue  # e.g. "Homework 1 due Sep 10, Homework 2 due Sep 17"
+        m = matches[0]
+        title = " ".join((line[:m.start()] + " " + line[m.end():]).split()).strip(" :-,()")
+        if not 4 <= len(title) <= 80 or not title[0].isalpha():
+            continue  # too short/long, or leftovers of a date list like "5, 10, 12"
+        event_type = next((kind for kind, pattern in _EVENT_KINDS if pattern.search(title)), None)
+        if event_type is None:
+            continue
+        date = _match_to_date(m, default_year)
+        if date is None:
+            continue
+        events.append({"title": title, "date": date, "type": event_type})
+
+    confident = (
+        default_year is not None
+        and multi_date_lines == 0
+        and len(events) >= REGEX_MIN_EVENTS
+        and len(events) * 2 > dated_lines
+        and all(a["date"] <= b["date"] for a, b in zip(events, events[1:]))
+    )
+    return course, events, confident
+
+
+def _default_year(syllabus_text: str) -> int | None:
+    """Year for dates written without one, or None if the text doesn't say."""
+    term = _TERM_YEAR.search(syllabus_text)
+    if term:
+        return int(term.group(1))
+    for m in _SCHEDULE_DATE.finditer(syllabus_text):
+        if m.group("year") or m.group("y"):
+            return _match_year(m)
+    return None
+
+
+def _match_year(m: re.Match) -> int:
+    year = int(m.group("year") or m.group("y"))
+    return year + 2000 if year < 100 else year
+
+
+def _match_to_date(m: re.Match, default_year: int | None) -> str | None:
+    """YYYY-MM-DD for a _SCHEDULE_DATE match, or None if it isn't a real date."""
+    if m.group("month"):
+        month = _MONTHS.index(m.group("month")[:3].lower()) + 1
+        day = int(m.group("day"))
+        year = _match_year(m) if m.group("year") else default_year
+    else:
+        month, day, year = int(m.group("m")), int(m.group("d")), _match_year(m)
+    if year is None:
+        return None
+    try:
+        return datetime(year, month, day).strftime("%Y-%m-%d")
+    except ValueError:
+        return None  # e.g. "Feb 30"
@@ -0,0 +1,14 @@
+-- Run this in Supabase SQL Editor (after supabase_add_course_name.sql).
+-- Lets the backend upsert events, so processing the same syllabus twice doesn't duplicate them.
+
+-- Remove existing duplicates first (keeps the oldest copy), otherwise the index can't be built.
+delete from public.events e
+using public.events d
+where e.user_id = d.user_id
+  and e.course_name = d.course_name
+  and e.event_title = d.event_title
+  and e.event_date = d.event_date
+  and (e.created_at, e.id) > (d.created_at, d.id);
+
+create unique index if not exists events_user_course_title_date_key
+  on public.events (user_id, course_name, event_title, event_date);
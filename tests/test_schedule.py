@@ -0,0 +1,92 @@
+from backend.schedule import extract_course_and_events_with_regex, find_course_code
+
+CLEAN_SCHEDULE = """CS 161 Intro to Programming - Fall 2025
+Homework 1 due      Sep 10
+Quiz 1              Sep 24
+Midterm exam        Oct. 8
+Project proposal due  10/29/2025
+Homework 5 due      Nov 19
+Final Exam          December 15, 2025
+"""
+
+
+def test_clean_schedule_is_confident():
+    course, events, confident = extract_course_and_events_with_regex(CLEAN_SCHEDULE)
+    assert course == "CS 161"
+    assert [ev["date"] for ev in events] == [
+        "2025-09-10", "2025-09-24", "2025-10-08", "2025-10-29", "2025-11-19", "2025-12-15",
+    ]
+    assert events[2] == {"title": "Midterm exam", "date": "2025-10-08", "type": "Exam"}
+    assert confident
+
+
+def test_words_starting_with_a_month_are_not_dates():
+    text = "Fall 2025\nQuiz 1 Decimal 3 conversions\nExam review Junior 2 session\nHomework Mayor 4 essay\n"
+    _, events, _ = extract_course_and_events_with_regex(text)
+    assert events == []
+
+
+def test_fractions_and_scores_are_not_dates():
+    text = "Fall 2025\nHomework worth 5/10 points\nchapters 3/4 quiz\nQuiz 1 graded out of 13/40\n"
+    _, events, _ = extract_course_and_events_with_regex(text)
+    assert events == []
+
+
+def test_room_numbers_are_not_course_codes():
+    assert find_course_code("Lectures in ROOM 101, PAGE 200\nCourse: EE 223") == "EE 223"
+    assert find_course_code("Meet in ROOM 101") is None
+
+
+def test_course_code_only_from_first_page():
+    assert find_course_code("Welcome\fSee BIO 101 next term") is None
+
+
+def test_not_confident_when_dates_go_backwards():
+    text = CLEAN_SCHEDULE.replace("Homework 5 due      Nov 19", "Homework 5 due      Jan 19")
+    _, events, confident = extract_course_and_events_with_regex(text)
+    assert len(events) == 6
+    assert not confident
+
+
+def test_not_confident_when_most_dated_lines_are_not_events():
+    topics = "".join(f"Lecture topic {i}   Sep {i}\n" for i in range(1, 10))
+    _, events, confident = extract_course_and_events_with_regex(CLEAN_SCHEDULE + topics)
+    assert len(events) == 6
+    assert not confident
+
+
+def test_no_year_in_text_means_no_events():
+    course, events, confident = extract_course_and_events_with_regex("CS 161\nMidterm exam Oct 8\n")
+    assert course == "CS 161"
+    assert events == []
+    assert not confident
+
+
+def test_four_digit_course_number_is_not_the_year():
+    text = "MATH 2001 Calculus - Spring 2026\n" + "".join(
+        f"Homework {i} due Jan {10 + i}\n" for i in range(1, 7)
+    )
+    _, events, confident = extract_course_and_events_with_regex(text)
+    assert [ev["date"] for ev in events][:2] == ["2026-01-11", "2026-01-12"]
+    assert confident
+
+
+def test_year_taken_from_a_spelled_out_schedule_date():
+    text = "MATH 2001 Calculus\nFinal Exam   May 4, 2026\nHomework 1 due Jan 20\n"
+    _, events, _ = extract_course_and_events_with_regex(text)
+    assert [ev["date"] for ev in events] == ["2026-05-04", "2026-01-20"]
+
+
+def test_unknown_year_is_never_confident():
+    text = "MATH 2001 Calculus\n" + "".join(f"Homework {i} due Jan {10 + i}\n" for i in range(1, 7))
+    _, events, confident = extract_course_and_events_with_regex(text)
+    assert events == []
+    assert not confident
+
+
+def test_lines_with_two_dates_are_skipped_and_not_confident():
+    text = CLEAN_SCHEDULE + "Homework 1 due Sep 10, Homework 2 due Sep 17\n"
+    _, events, confident = extract_course_and_events_with_regex(text)
+    assert all("Homework 2" not in ev["title"] for ev in events)
+    assert len(events) == 6
+    assert not confident